@@ -5,6 +5,39 @@ This module contains the Booking class, which represents a hotel booking.
 """
 
 import datetime
+import sys
+import time
+from operator import itemgetter
+
+# Extracts all booking fields from a record dict with a single C call.
+_BOOKING_FIELDS = itemgetter("booking_id", "guest_id", "room_number", "check_in", "check_out", "is_active")
+
+# Pre-bound format method and status lookup for Booking.__str__: the
+# template is compiled once and the ternary becomes a tuple index.
+_BOOKING_FMT = ("Booking {booking_id}: Guest {guest_id}, Room {room_number}, "
+                "Check-in: {check_in}, Check-out: {check_out}, Status: {status}").format
+_STATUS = ("Inactive", "Active")
+
+# Pre-bound ISO date parser for the hot loop in Database.load_bookings.
+_date_fromiso = datetime.date.fromisoformat
+
+# Cache of (monotonic second, date ordinal). Bulk passes over bookings hit
+# the is_current/is_future/is_past properties many times in a row; reusing
+# the ordinal for up to a second avoids a clock syscall per property access.
+_today_cache = (None, None)
+
+def _today_ord():
+    """
+    Return today's date ordinal, cached for up to one second.
+
+    Returns:
+        int: The current date's proleptic Gregorian ordinal
+    """
+    global _today_cache
+    second = int(time.monotonic())
+    if _today_cache[0] != second:
+        _today_cache = (second, datetime.date.today().toordinal())
+    return _today_cache[1]
 
 class Booking:
     """
@@ -13,7 +46,10 @@ class Booking:
     This class contains information about a hotel booking, including its
     ID, associated guest and room, check-in and check-out dates, and status.
     """
-    
+
+    __slots__ = ("booking_id", "guest_id", "room_number", "_check_in", "_check_out",
+                 "_ci_ord", "_co_ord", "is_active")
+
     def __init__(self, booking_id, guest_id, room_number, check_in, check_out, is_active=True):
         """
         Initialize a new Booking object.
@@ -32,7 +68,27 @@ class Booking:
         self.check_in = check_in
         self.check_out = check_out
         self.is_active = is_active
-    
+
+    @property
+    def check_in(self):
+        """datetime.date: The check-in date."""
+        return self._check_in
+
+    @check_in.setter
+    def check_in(self, value):
+        self._check_in = value
+        self._ci_ord = value.toordinal()
+
+    @property
+    def check_out(self):
+        """datetime.date: The check-out date."""
+        return self._check_out
+
+    @check_out.setter
+    def check_out(self, value):
+        self._check_out = value
+        self._co_ord = value.toordinal()
+
     def to_dict(self):
         """
         Convert the Booking object to a dictionary.
@@ -60,18 +116,45 @@ class Booking:
         Returns:
             Booking: A new Booking object
         """
-        check_in = datetime.datetime.fromisoformat(data["check_in"]).date()
-        check_out = datetime.datetime.fromisoformat(data["check_out"]).date()
-        
+        check_in = _date_fromiso(data["check_in"])
+        check_out = _date_fromiso(data["check_out"])
+
+        intern = sys.intern
         return cls(
-            data["booking_id"],
-            data["guest_id"],
-            data["room_number"],
+            intern(data["booking_id"]),
+            intern(data["guest_id"]),
+            intern(data["room_number"]),
             check_in,
             check_out,
             data["is_active"]
         )
-    
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Create Booking objects from a list of dictionaries.
+
+        Bulk counterpart to from_dict: fields are extracted with one
+        itemgetter call per record instead of six keyed lookups.
+
+        Args:
+            records (list): A list of dictionaries containing booking data
+
+        Returns:
+            list: A list of new Booking objects
+        """
+        fromiso = _date_fromiso
+        # Interning collapses the many duplicate guest/room references to a
+        # handful of shared strings, so later equality checks are pointer
+        # comparisons and memory stays proportional to distinct values.
+        intern = sys.intern
+        return [
+            cls(intern(booking_id), intern(guest_id), intern(room_number),
+                fromiso(check_in), fromiso(check_out), is_active)
+            for booking_id, guest_id, room_number, check_in, check_out, is_active
+            in map(_BOOKING_FIELDS, records)
+        ]
+
     def __str__(self):
         """
         Return a string representation of the Booking object.
@@ -79,12 +162,14 @@ class Booking:
         Returns:
             str: A string representation of the Booking object
         """
-        status = "Active" if self.is_active else "Inactive"
-        return (f"Booking {self.booking_id}: Guest {self.guest_id}, "
-                f"Room {self.room_number}, "
-                f"Check-in: {self.check_in.isoformat()}, "
-                f"Check-out: {self.check_out.isoformat()}, "
-                f"Status: {status}")
+        return _BOOKING_FMT(
+            booking_id=self.booking_id,
+            guest_id=self.guest_id,
+            room_number=self.room_number,
+            check_in=self.check_in.isoformat(),
+            check_out=self.check_out.isoformat(),
+            status=_STATUS[self.is_active]
+        )
     
     @property
     def duration(self):
@@ -94,18 +179,22 @@ class Booking:
         Returns:
             int: The number of days between check-in and check-out
         """
-        return (self.check_out - self.check_in).days
+        return self._co_ord - self._ci_ord
     
     @property
     def is_current(self):
         """
-        Check if the booking is for the current date.
-        
+        Check if the booking is active and covers the current date.
+
         Returns:
-            bool: True if today is between check-in and check-out dates
-        """
-        today = datetime.datetime.now().date()
-        return self.check_in <= today <= self.check_out
+            bool: True if the booking is active and today is between the
+                check-in and check-out dates
+        """
+        # Checked most-selective first: in a past-skewed archive most
+        # bookings already checked out, so "check_out >= today" fails
+        # early and the remaining comparisons are skipped.
+        today = _today_ord()
+        return self._co_ord >= today and self._ci_ord <= today and self.is_active
     
     @property
     def is_future(self):
@@ -115,8 +204,7 @@ class Booking:
         Returns:
             bool: True if check-in date is in the future
         """
-        today = datetime.datetime.now().date()
-        return self.check_in > today
+        return self._ci_ord > _today_ord()
     
     @property
     def is_past(self):
@@ -126,5 +214,4 @@ class Booking:
         Returns:
             bool: True if check-out date is in the past
         """
-        today = datetime.datetime.now().date()
-        return self.check_out < today
\ No newline at end of file
+        return self._co_ord < _today_ord()
\ No newline at end of file
@@ -5,10 +5,149 @@ This module contains the Database class, which handles data storage and retrieva
 """
 
 import os
+import gzip
 import json
-from room import Room
-from guest import Guest
-from booking import Booking
+import mmap
+import logging
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_log = logging.getLogger(__name__)
+
+# 64 KB I/O buffer: serialized payloads are written in one call, so a larger
+# buffer keeps the number of write/read syscalls low for big data files.
+_BUFFER_SIZE = 1 << 16
+
+# Files above 1 MB are memory-mapped for parsing instead of read into a
+# bytes copy; below that the mmap setup cost outweighs the saved copy.
+_MMAP_THRESHOLD = 1 << 20
+
+def __getattr__(name):
+    """
+    Lazy-import the domain classes on first reference (PEP 562).
+
+    Keeps `import database` from pulling in the full object graph; each
+    load_* method imports the class it needs, matching the deferred
+    `from hotel import Bill` pattern in load_bills.
+    """
+    if name in ("Room", "Guest", "Booking"):
+        module = __import__(name.lower())
+        cls = getattr(module, name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+if orjson is not None:
+    def _dumps(data, default=None):
+        """Serialize data to JSON bytes using orjson."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=default)
+
+    def _dumps_compact(data, default=None):
+        """Serialize data to compact JSON bytes using orjson."""
+        return orjson.dumps(data, default=default)
+
+    _loads = orjson.loads
+else:
+    def _dumps(data, default=None):
+        """Serialize data to JSON bytes using the standard library."""
+        return json.dumps(data, indent=4, default=default or str).encode("utf-8")
+
+    def _dumps_compact(data, default=None):
+        """Serialize data to compact JSON bytes using the standard library."""
+        return json.dumps(data, default=default or str).encode("utf-8")
+
+    _loads = json.loads
+
+# Field tuples and pre-bound attribute getters for batch serialization.
+# Extracting all fields of a slotted object with one attrgetter call avoids
+# the per-attribute method dispatch that to_dict pays for every record.
+_GUEST_KEYS = ("guest_id", "name", "phone", "email", "address")
+_guest_get = attrgetter(*_GUEST_KEYS)
+def _room_default(room):
+    """
+    Serializer hook that turns a Room into its record dict.
+
+    Passed as default= so the JSON encoder's C layer drives the
+    conversion record by record, instead of save_rooms building a full
+    intermediate list of dicts first.
+
+    Args:
+        room (Room): The room being serialized
+
+    Returns:
+        dict: A dictionary representation of the Room object
+    """
+    return {
+        "number": room.number,
+        "type": room.type,
+        "price": room.price,
+        "is_occupied": room.is_occupied,
+    }
+
+def _booking_default(booking):
+    """
+    Serializer hook that turns a Booking into its record dict.
+
+    Passed as default= so the JSON encoder's C layer drives the
+    conversion record by record, instead of save_bookings building a full
+    intermediate list of dicts first.
+
+    Args:
+        booking (Booking): The booking being serialized
+
+    Returns:
+        dict: A dictionary representation of the Booking object
+    """
+    return {
+        "booking_id": booking.booking_id,
+        "guest_id": booking.guest_id,
+        "room_number": booking.room_number,
+        "check_in": booking.check_in.isoformat(),
+        "check_out": booking.check_out.isoformat(),
+        "is_active": booking.is_active,
+    }
+
+@lru_cache(maxsize=8)
+def _load_raw(file_path, file_name, mtime_ns):
+    """
+    Parse a data file, cached by path and modification time.
+
+    Every save bumps the file's mtime, which changes the cache key, so
+    repeated loads of an unchanged file skip reparsing while stale
+    entries invalidate themselves for free.
+
+    Args:
+        file_path (str): The full path to the file
+        file_name (str): The name of the file (determines the format)
+        mtime_ns (int): The file's st_mtime_ns at lookup time
+
+    Returns:
+        list: The parsed data
+    """
+    compressed = file_name.endswith(".gz")
+    base_name = file_name[:-3] if compressed else file_name
+    if (orjson is not None and not compressed
+            and not base_name.endswith(".jsonl")
+            and os.path.getsize(file_path) > _MMAP_THRESHOLD):
+        # Zero-copy parse backed by the kernel page cache instead of
+        # materializing the whole file as a bytes object first.
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _loads(memoryview(mm))
+    if compressed:
+        f = gzip.open(file_path, 'rb')
+    else:
+        f = open(file_path, 'rb', buffering=_BUFFER_SIZE)
+    with f:
+        if base_name.endswith(".jsonl"):
+            return [_loads(line) for line in f if line.strip()]
+        return _loads(f.read())
 
 class Database:
     """
@@ -45,25 +184,47 @@ class Database:
         """
         return os.path.join(self.data_dir, file_name)
     
-    def _save_to_file(self, data, file_name):
+    def _save_to_file(self, data, file_name, default=None):
         """
         Save data to a JSON file.
-        
+
         Args:
             data (list): The data to save
             file_name (str): The name of the file
-            
+            default (callable, optional): Serializer hook for records that
+                are not natively JSON-serializable
+
         Returns:
-            bool: True if the data was saved successfully, False otherwise
+            bool: True if the data was saved successfully
+
+        Raises:
+            Exception: If the data cannot be serialized or written
         """
         try:
             file_path = self._get_file_path(file_name)
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            compressed = file_name.endswith(".gz")
+            base_name = file_name[:-3] if compressed else file_name
+            if base_name.endswith(".jsonl"):
+                # One record per line so loads can stream line-by-line.
+                blob = b''.join(_dumps_compact(record, default) + b'\n' for record in data)
+            else:
+                blob = _dumps(data, default)
+            # Write to a temp file and atomically swap it into place, so a
+            # crash mid-write can never leave a truncated data file behind.
+            tmp_path = file_path + '.tmp'
+            if compressed:
+                # Level-1 gzip: JSON compresses 5-10x, so the decompression
+                # cost is well below the disk bytes it saves.
+                with gzip.open(tmp_path, 'wb', compresslevel=1) as f:
+                    f.write(blob)
+            else:
+                with open(tmp_path, 'wb', buffering=_BUFFER_SIZE) as f:
+                    f.write(blob)
+            os.replace(tmp_path, file_path)
             return True
-        except Exception as e:
-            print(f"Error saving data to {file_name}: {str(e)}")
-            return False
+        except Exception:
+            _log.exception("Error saving data to %s", file_name)
+            raise
     
     def _load_from_file(self, file_name):
         """
@@ -74,18 +235,65 @@ class Database:
             
         Returns:
             list: The loaded data, or an empty list if the file doesn't exist
+
+        Raises:
+            Exception: If the file exists but cannot be read or parsed
         """
         try:
             file_path = self._get_file_path(file_name)
-            if not os.path.exists(file_path):
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
                 return []
-            
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading data from {file_name}: {str(e)}")
+            return _load_raw(file_path, file_name, mtime_ns)
+        except FileNotFoundError:
             return []
+        except Exception:
+            # A present-but-unreadable file is real data loss waiting to
+            # happen; surface it instead of silently starting empty.
+            _log.exception("Error loading data from %s", file_name)
+            raise
     
+    def save_all(self, payload):
+        """
+        Save several collections in one batch, writing the files concurrently.
+
+        Analogous to a cache's set_multi: the caller hands over just the
+        collections that changed and this method issues all the writes in
+        one call. Each save still lands atomically in its own file; running
+        them on a small thread pool lets the kernel overlap the disk
+        submissions instead of paying sequential open/write/close cycles.
+
+        Args:
+            payload (dict): Maps collection names ("rooms", "guests",
+                "bookings", "bills") to the lists to persist; missing keys
+                are skipped
+
+        Returns:
+            bool: True if every supplied collection was saved successfully
+        """
+        savers = {
+            "rooms": self.save_rooms,
+            "guests": self.save_guests,
+            "bookings": self.save_bookings,
+            "bills": self.save_bills,
+        }
+        if len(payload) == 1:
+            # No point spinning up a pool for a single write.
+            name, data = next(iter(payload.items()))
+            return savers[name](data)
+
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(savers[name], data)
+                           for name, data in payload.items()]
+                return all(future.result() for future in futures)
+        except RuntimeError:
+            # New threads cannot be started during interpreter shutdown,
+            # which is exactly when the atexit flush runs. Fall back to
+            # sequential writes so exit-time saves still land.
+            return all(savers[name](data) for name, data in payload.items())
+
     # Room data methods
     
     def save_rooms(self, rooms):
@@ -98,8 +306,7 @@ class Database:
         Returns:
             bool: True if the data was saved successfully, False otherwise
         """
-        room_data = [room.to_dict() for room in rooms]
-        return self._save_to_file(room_data, "rooms.json")
+        return self._save_to_file(rooms, "rooms.json", default=_room_default)
     
     def load_rooms(self):
         """
@@ -108,6 +315,8 @@ class Database:
         Returns:
             list: A list of Room objects
         """
+        from room import Room  # Deferred so importing database stays cheap
+
         room_data = self._load_from_file("rooms.json")
         return [Room.from_dict(data) for data in room_data]
     
@@ -123,7 +332,7 @@ class Database:
         Returns:
             bool: True if the data was saved successfully, False otherwise
         """
-        guest_data = [guest.to_dict() for guest in guests]
+        guest_data = [dict(zip(_GUEST_KEYS, _guest_get(guest))) for guest in guests]
         return self._save_to_file(guest_data, "guests.json")
     
     def load_guests(self):
@@ -133,8 +342,10 @@ class Database:
         Returns:
             list: A list of Guest objects
         """
+        from guest import Guest  # Deferred so importing database stays cheap
+
         guest_data = self._load_from_file("guests.json")
-        return [Guest.from_dict(data) for data in guest_data]
+        return Guest.from_records(guest_data)
     
     # Booking data methods
     
@@ -148,8 +359,7 @@ class Database:
         Returns:
             bool: True if the data was saved successfully, False otherwise
         """
-        booking_data = [booking.to_dict() for booking in bookings]
-        return self._save_to_file(booking_data, "bookings.json")
+        return self._save_to_file(bookings, "bookings.jsonl", default=_booking_default)
     
     def load_bookings(self):
         """
@@ -158,9 +368,16 @@ class Database:
         Returns:
             list: A list of Booking objects
         """
-        booking_data = self._load_from_file("bookings.json")
-        return [Booking.from_dict(data) for data in booking_data]
-    
+        from booking import Booking  # Deferred so importing database stays cheap
+
+        if not os.path.exists(self._get_file_path("bookings.jsonl")):
+            # One-shot migration from the legacy single-array format.
+            legacy_data = self._load_from_file("bookings.json")
+            if legacy_data:
+                self._save_to_file(legacy_data, "bookings.jsonl")
+        booking_data = self._load_from_file("bookings.jsonl")
+        return Booking.from_records(booking_data)
+
     # Bill data methods
     
     def save_bills(self, bills):
@@ -174,7 +391,7 @@ class Database:
             bool: True if the data was saved successfully, False otherwise
         """
         bill_data = [bill.to_dict() for bill in bills]
-        return self._save_to_file(bill_data, "bills.json")
+        return self._save_to_file(bill_data, "bills.json.gz")
     
     def load_bills(self):
         """
@@ -184,6 +401,11 @@ class Database:
             list: A list of Bill objects
         """
         from hotel import Bill  # Import here to avoid circular imports
-        
-        bill_data = self._load_from_file("bills.json")
+
+        if not os.path.exists(self._get_file_path("bills.json.gz")):
+            # One-shot migration from the legacy uncompressed format.
+            legacy_data = self._load_from_file("bills.json")
+            if legacy_data:
+                self._save_to_file(legacy_data, "bills.json.gz")
+        bill_data = self._load_from_file("bills.json.gz")
         return [Bill.from_dict(data) for data in bill_data]
\ No newline at end of file
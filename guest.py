@@ -4,6 +4,12 @@ Hotel Management System - Guest Module
 This module contains the Guest class, which represents a hotel guest.
 """
 
+import sys
+from operator import itemgetter
+
+# Extracts all guest fields from a record dict with a single C call.
+_GUEST_FIELDS = itemgetter("guest_id", "name", "phone", "email", "address")
+
 class Guest:
     """
     Guest class representing a hotel guest.
@@ -11,7 +17,9 @@ class Guest:
     This class contains information about a hotel guest, including their
     ID, name, contact information, and address.
     """
-    
+
+    __slots__ = ("guest_id", "name", "phone", "email", "address")
+
     def __init__(self, guest_id, name, phone, email, address):
         """
         Initialize a new Guest object.
@@ -62,7 +70,27 @@ class Guest:
             data["email"],
             data["address"]
         )
-    
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Create Guest objects from a list of dictionaries.
+
+        Bulk counterpart to from_dict: fields are extracted with one
+        itemgetter call per record instead of five keyed lookups.
+
+        Args:
+            records (list): A list of dictionaries containing guest data
+
+        Returns:
+            list: A list of new Guest objects
+        """
+        intern = sys.intern
+        return [
+            cls(intern(guest_id), name, phone, email, address)
+            for guest_id, name, phone, email, address in map(_GUEST_FIELDS, records)
+        ]
+
     def __str__(self):
         """
         Return a string representation of the Guest object.
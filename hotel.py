@@ -6,42 +6,120 @@ controller for the hotel management system.
 """
 
 import os
+import sys
 import json
+import atexit
 import datetime
-from uuid import uuid4
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
+from sortedcontainers import SortedKeyList
 from room import Room
 from guest import Guest
 from booking import Booking
 from database import Database
 
+# Sort key for the per-room booking lists.
+_BY_CHECK_IN = attrgetter("check_in")
+
+# Pre-compiled row formats and headers for the list/search tables, so the
+# per-row loops call one bound format and the whole table is emitted with a
+# single write instead of one print per row.
+_ROOM_ROW = "{:<10} {:<15} ${:<9.2f} {:<10}".format
+_GUEST_ROW = "{:<10} {:<20} {:<15} {:<25} {:<20}".format
+_BOOKING_ROW = "{:<10} {:<10} {:<10} {:<12} {:<12} {:<10}".format
+_BILL_ROW = "{:<10} {:<10} ${:<9.2f} {:<10} {:<12}".format
+
+_ROOM_HEADER = ("-" * 60 + "\n"
+                + "{:<10} {:<15} {:<10} {:<10}".format("Number", "Type", "Price", "Status") + "\n"
+                + "-" * 60 + "\n")
+_GUEST_HEADER = ("-" * 80 + "\n"
+                 + _GUEST_ROW("ID", "Name", "Phone", "Email", "Address") + "\n"
+                 + "-" * 80 + "\n")
+_BOOKING_HEADER = ("-" * 80 + "\n"
+                   + _BOOKING_ROW("ID", "Guest ID", "Room", "Check-in", "Check-out", "Status") + "\n"
+                   + "-" * 80 + "\n")
+_BILL_HEADER = ("-" * 80 + "\n"
+                + "{:<10} {:<10} {:<10} {:<10} {:<12}".format("Bill ID", "Booking ID", "Amount", "Status", "Payment Date") + "\n"
+                + "-" * 80 + "\n")
+
+def _parse_date(value):
+    """
+    Parse a YYYY-MM-DD string into a date.
+
+    date.fromisoformat is C-implemented and far cheaper than strptime,
+    which re-interprets its format string on every call. Callers that
+    already validated at the input boundary may pass a date through
+    unchanged.
+
+    Args:
+        value (str or datetime.date): The date string, or an already
+            parsed date
+
+    Returns:
+        datetime.date: The parsed date
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value.strip())
+
+def _max_numeric_id(ids):
+    """
+    Get the largest numeric ID in an iterable of ID strings.
+
+    Args:
+        ids (iterable): ID strings; non-numeric (legacy UUID) IDs are skipped
+
+    Returns:
+        int: The largest numeric ID, or 0 if there is none
+    """
+    return max((int(item) for item in ids if item.isdigit()), default=0)
+
+@dataclass(slots=True)
 class Bill:
-    """Class representing a bill for a booking."""
-    
-    def __init__(self, bill_id, booking_id, amount, status="UNPAID"):
-        """Initialize a new Bill object."""
-        self.bill_id = bill_id
-        self.booking_id = booking_id
-        self.amount = amount
-        self.status = status
-        self.payment_date = None
-    
+    """Class representing a bill for a booking.
+
+    Amounts are held internally as integer cents so that comparisons are
+    exact integer branches; the `amount` property exposes dollars for
+    display and serialization.
+    """
+
+    bill_id: str
+    booking_id: str
+    amount_cents: int
+    status: str = "UNPAID"
+    payment_date: datetime.date | None = None
+
+    @property
+    def amount(self):
+        """float: The bill amount in dollars."""
+        return self.amount_cents / 100
+
     def to_dict(self):
         """Convert the Bill object to a dictionary."""
         return {
             "bill_id": self.bill_id,
             "booking_id": self.booking_id,
-            "amount": self.amount,
+            "amount": self.amount_cents / 100,
             "status": self.status,
             "payment_date": self.payment_date.isoformat() if self.payment_date else None
         }
-    
+
     @classmethod
     def from_dict(cls, data):
         """Create a Bill object from a dictionary."""
-        bill = cls(data["bill_id"], data["booking_id"], data["amount"], data["status"])
-        if data["payment_date"]:
-            bill.payment_date = datetime.datetime.fromisoformat(data["payment_date"]).date()
-        return bill
+        payment_date = data["payment_date"]
+        return cls(
+            data["bill_id"],
+            data["booking_id"],
+            int(round(data["amount"] * 100)),
+            data["status"],
+            datetime.datetime.fromisoformat(payment_date).date() if payment_date else None
+        )
 
 class HotelManager:
     """
@@ -51,28 +129,149 @@ class HotelManager:
     handling rooms, guests, bookings, and billing operations.
     """
     
+    # Collections (and their indexes) that load_data drops for a reload.
+    _LAZY_ATTRS = ("rooms", "guests", "bookings", "bills", "_rooms_by_number",
+                   "_guests_by_id", "_bookings_by_id", "_bookings_by_room",
+                   "_bill_by_id", "_bill_by_booking_id", "_guest_search_index",
+                   "_next_guest_id", "_next_booking_id", "_next_bill_id")
+
     def __init__(self):
         """Initialize the HotelManager with a database connection."""
         self.db = Database()
-        self.rooms = []
-        self.guests = []
-        self.bookings = []
-        self.bills = []
-        self.load_data()
-    
+        self._dirty = set()
+        # Monotonic data version and the report cache keyed on it; any
+        # mutation bumps the version, which implicitly invalidates every
+        # cached report.
+        self._data_version = 0
+        self._report_cache = {}
+        self._stats_cache = None
+        # Persist anything still pending when the interpreter shuts down.
+        atexit.register(self.flush)
+
+    @cached_property
+    def rooms(self):
+        """list: The Room objects, loaded from the database on first access."""
+        return self.db.load_rooms()
+
+    @cached_property
+    def guests(self):
+        """list: The Guest objects, loaded from the database on first access."""
+        return self.db.load_guests()
+
+    @cached_property
+    def bookings(self):
+        """list: The Booking objects, loaded from the database on first access."""
+        return self.db.load_bookings()
+
+    @cached_property
+    def bills(self):
+        """list: The Bill objects, loaded from the database on first access."""
+        return self.db.load_bills()
+
+    @cached_property
+    def _rooms_by_number(self):
+        """dict: Room lookup index, built on first access."""
+        return {room.number: room for room in self.rooms}
+
+    @cached_property
+    def _guests_by_id(self):
+        """dict: Guest lookup index, built on first access."""
+        return {guest.guest_id: guest for guest in self.guests}
+
+    @cached_property
+    def _bookings_by_id(self):
+        """dict: Booking lookup index, built on first access."""
+        return {booking.booking_id: booking for booking in self.bookings}
+
+    @cached_property
+    def _bookings_by_room(self):
+        """dict: Per-room sorted booking index, built on first access."""
+        index = {}
+        for booking in self.bookings:
+            index.setdefault(
+                booking.room_number, SortedKeyList(key=_BY_CHECK_IN)).add(booking)
+        return index
+
+    @cached_property
+    def _bill_by_id(self):
+        """dict: Bill lookup index, built on first access."""
+        return {bill.bill_id: bill for bill in self.bills}
+
+    @cached_property
+    def _bill_by_booking_id(self):
+        """dict: Booking-to-bill index, built on first access."""
+        return {bill.booking_id: bill for bill in self.bills}
+
+    @cached_property
+    def _guest_search_index(self):
+        """list: (guest, casefolded name) pairs, built on first access."""
+        return [(guest, guest.name.casefold()) for guest in self.guests]
+
+    @cached_property
+    def _next_guest_id(self):
+        """int: The next sequential guest ID, seeded from existing IDs."""
+        return _max_numeric_id(guest.guest_id for guest in self.guests) + 1
+
+    @cached_property
+    def _next_booking_id(self):
+        """int: The next sequential booking ID, seeded from existing IDs.
+
+        Bills outlive their bookings (cancelling removes the booking but
+        never its bill), so the booking IDs referenced by bills count
+        toward the seed too; otherwise cancelling the highest-numbered
+        booking and restarting would reuse its ID and inherit its stale
+        bill.
+        """
+        return max(
+            _max_numeric_id(booking.booking_id for booking in self.bookings),
+            _max_numeric_id(bill.booking_id for bill in self.bills),
+        ) + 1
+
+    @cached_property
+    def _next_bill_id(self):
+        """int: The next sequential bill ID, seeded from existing IDs."""
+        return _max_numeric_id(bill.bill_id for bill in self.bills) + 1
+
     def load_data(self):
-        """Load all data from the database."""
-        self.rooms = self.db.load_rooms()
-        self.guests = self.db.load_guests()
-        self.bookings = self.db.load_bookings()
-        self.bills = self.db.load_bills()
-    
+        """Drop the loaded collections so they reload from the database."""
+        for attr in self._LAZY_ATTRS:
+            self.__dict__.pop(attr, None)
+
     def save_data(self):
-        """Save all data to the database."""
-        self.db.save_rooms(self.rooms)
-        self.db.save_guests(self.guests)
-        self.db.save_bookings(self.bookings)
-        self.db.save_bills(self.bills)
+        """Save all loaded collections to the database in one batch."""
+        loaded = self.__dict__
+        # A collection that was never loaded cannot have changed.
+        payload = {name: loaded[name]
+                   for name in ("rooms", "guests", "bookings", "bills")
+                   if name in loaded}
+        if payload:
+            self.db.save_all(payload)
+        self._dirty.clear()
+
+    def _mark_dirty(self, collection):
+        """
+        Record that a collection changed since the last flush.
+
+        Args:
+            collection (str): One of "rooms", "guests", "bookings", "bills"
+        """
+        self._dirty.add(collection)
+        self._data_version += 1
+
+    def flush(self):
+        """Write only the collections modified since the last flush."""
+        dirty, self._dirty = self._dirty, set()
+        if dirty:
+            self.db.save_all({name: getattr(self, name) for name in dirty})
+
+    def __enter__(self):
+        """Enter a batching block; mutations accumulate until exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Flush pending changes when the batching block ends."""
+        self.flush()
+        return False
     
     # Room Management Methods
     
@@ -94,7 +293,8 @@ class HotelManager:
         
         room = Room(room_number, room_type, float(price))
         self.rooms.append(room)
-        self.save_data()
+        self._rooms_by_number[room_number] = room
+        self._mark_dirty("rooms")
         return True
     
     def update_room(self, room_number, room_type=None, price=None):
@@ -123,23 +323,30 @@ class HotelManager:
             except ValueError:
                 print("Invalid price format. Price not updated.")
         
-        self.save_data()
+        self._mark_dirty("rooms")
         return True
     
+    @property
+    def rooms_by_number(self):
+        """dict: The rooms keyed by room number, for direct O(1) lookups."""
+        return self._rooms_by_number
+
+    @property
+    def guests_by_id(self):
+        """dict: The guests keyed by guest ID, for direct O(1) lookups."""
+        return self._guests_by_id
+
     def find_room(self, room_number):
         """
         Find a room by its number.
-        
+
         Args:
             room_number (str): The room number to find
-            
+
         Returns:
             Room: The room object if found, None otherwise
         """
-        for room in self.rooms:
-            if room.number == room_number:
-                return room
-        return None
+        return self._rooms_by_number.get(room_number)
     
     def view_all_rooms(self):
         """Display all rooms in the hotel."""
@@ -147,14 +354,10 @@ class HotelManager:
             print("No rooms available.")
             return
         
-        print("\nROOM LIST:")
-        print("-" * 60)
-        print(f"{'Number':<10} {'Type':<15} {'Price':<10} {'Status':<10}")
-        print("-" * 60)
-        
-        for room in self.rooms:
-            status = "Occupied" if room.is_occupied else "Available"
-            print(f"{room.number:<10} {room.type:<15} ${room.price:<9.2f} {status:<10}")
+        rows = [_ROOM_ROW(room.number, room.type, room.price,
+                          "Occupied" if room.is_occupied else "Available")
+                for room in self.rooms]
+        sys.stdout.write("\nROOM LIST:\n" + _ROOM_HEADER + "\n".join(rows) + "\n")
     
     # Guest Management Methods
     
@@ -171,10 +374,14 @@ class HotelManager:
         Returns:
             str: The guest ID if registration was successful
         """
-        guest_id = str(uuid4())[:8]  # Generate a unique ID
+        guest_id = f"{self._next_guest_id:08d}"  # Sequential ID, legacy 8-char width
+        self._next_guest_id += 1
         guest = Guest(guest_id, name, phone, email, address)
         self.guests.append(guest)
-        self.save_data()
+        self._guests_by_id[guest_id] = guest
+        if "_guest_search_index" in self.__dict__:
+            self._guest_search_index.append((guest, guest.name.casefold()))
+        self._mark_dirty("guests")
         return guest_id
     
     def update_guest(self, guest_id, name=None, phone=None, email=None, address=None):
@@ -207,8 +414,10 @@ class HotelManager:
         
         if address and address.strip():
             guest.address = address
-        
-        self.save_data()
+
+        # Rebuild lazily in case the name changed
+        self.__dict__.pop("_guest_search_index", None)
+        self._mark_dirty("guests")
         return True
     
     def find_guest(self, guest_id):
@@ -221,10 +430,7 @@ class HotelManager:
         Returns:
             Guest: The guest object if found, None otherwise
         """
-        for guest in self.guests:
-            if guest.guest_id == guest_id:
-                return guest
-        return None
+        return self._guests_by_id.get(guest_id)
     
     def search_guest(self, search_term):
         """
@@ -236,24 +442,17 @@ class HotelManager:
         Returns:
             list: A list of matching guest objects
         """
-        results = []
-        
-        for guest in self.guests:
-            if (search_term.lower() in guest.name.lower() or 
-                search_term == guest.guest_id):
-                results.append(guest)
+        term = search_term.casefold()
+        results = [guest for guest, name in self._guest_search_index
+                   if term in name or search_term == guest.guest_id]
         
         if not results:
             print(f"No guests found matching '{search_term}'.")
         else:
-            print("\nSEARCH RESULTS:")
-            print("-" * 80)
-            print(f"{'ID':<10} {'Name':<20} {'Phone':<15} {'Email':<25} {'Address':<20}")
-            print("-" * 80)
-            
-            for guest in results:
-                print(f"{guest.guest_id:<10} {guest.name:<20} {guest.phone:<15} {guest.email:<25} {guest.address:<20}")
-        
+            rows = [_GUEST_ROW(guest.guest_id, guest.name, guest.phone, guest.email, guest.address)
+                    for guest in results]
+            sys.stdout.write("\nSEARCH RESULTS:\n" + _GUEST_HEADER + "\n".join(rows) + "\n")
+
         return results
     
     def view_all_guests(self):
@@ -262,13 +461,9 @@ class HotelManager:
             print("No guests registered.")
             return
         
-        print("\nGUEST LIST:")
-        print("-" * 80)
-        print(f"{'ID':<10} {'Name':<20} {'Phone':<15} {'Email':<25} {'Address':<20}")
-        print("-" * 80)
-        
-        for guest in self.guests:
-            print(f"{guest.guest_id:<10} {guest.name:<20} {guest.phone:<15} {guest.email:<25} {guest.address:<20}")
+        rows = [_GUEST_ROW(guest.guest_id, guest.name, guest.phone, guest.email, guest.address)
+                for guest in self.guests]
+        sys.stdout.write("\nGUEST LIST:\n" + _GUEST_HEADER + "\n".join(rows) + "\n")
     
     # Booking Management Methods
     
@@ -277,30 +472,42 @@ class HotelManager:
         Create a new booking.
         
         Args:
-            guest_id (str): The guest ID
-            room_number (str): The room number
-            check_in (str): Check-in date in YYYY-MM-DD format
-            check_out (str): Check-out date in YYYY-MM-DD format
-            
+            guest_id (str or Guest): The guest ID, or an already resolved
+                Guest object
+            room_number (str or Room): The room number, or an already
+                resolved Room object
+            check_in (str or datetime.date): Check-in date in YYYY-MM-DD
+                format, or an already parsed date
+            check_out (str or datetime.date): Check-out date in YYYY-MM-DD
+                format, or an already parsed date
+
         Returns:
             str: The booking ID if creation was successful, None otherwise
-            
+
         Raises:
             ValueError: If the date format is invalid or check-out is before check-in
         """
-        guest = self.find_guest(guest_id)
-        if not guest:
-            print(f"Guest with ID {guest_id} not found.")
-            return None
-        
-        room = self.find_room(room_number)
-        if not room:
-            print(f"Room {room_number} not found.")
-            return None
+        # Callers that already looked the objects up can pass them in
+        # directly and skip the second round of index probes.
+        if isinstance(guest_id, Guest):
+            guest, guest_id = guest_id, guest_id.guest_id
+        else:
+            guest = self.find_guest(guest_id)
+            if not guest:
+                print(f"Guest with ID {guest_id} not found.")
+                return None
+
+        if isinstance(room_number, Room):
+            room, room_number = room_number, room_number.number
+        else:
+            room = self.find_room(room_number)
+            if not room:
+                print(f"Room {room_number} not found.")
+                return None
         
         try:
-            check_in_date = datetime.datetime.strptime(check_in, "%Y-%m-%d").date()
-            check_out_date = datetime.datetime.strptime(check_out, "%Y-%m-%d").date()
+            check_in_date = _parse_date(check_in)
+            check_out_date = _parse_date(check_out)
             
             if check_out_date <= check_in_date:
                 raise ValueError("Check-out date must be after check-in date.")
@@ -310,10 +517,14 @@ class HotelManager:
                 print(f"Room {room_number} is not available for the selected dates.")
                 return None
             
-            booking_id = str(uuid4())[:8]  # Generate a unique ID
+            booking_id = f"{self._next_booking_id:08d}"  # Sequential ID, legacy 8-char width
+            self._next_booking_id += 1
             booking = Booking(booking_id, guest_id, room_number, check_in_date, check_out_date)
             self.bookings.append(booking)
-            self.save_data()
+            self._bookings_by_id[booking_id] = booking
+            self._bookings_by_room.setdefault(
+                room_number, SortedKeyList(key=_BY_CHECK_IN)).add(booking)
+            self._mark_dirty("bookings")
             return booking_id
             
         except ValueError as e:
@@ -325,12 +536,14 @@ class HotelManager:
         
         Args:
             booking_id (str): The booking ID to update
-            check_in (str, optional): The new check-in date
-            check_out (str, optional): The new check-out date
-            
+            check_in (str or datetime.date, optional): The new check-in
+                date; blank or None keeps the current value
+            check_out (str or datetime.date, optional): The new check-out
+                date; blank or None keeps the current value
+
         Returns:
             bool: True if the booking was updated successfully, False otherwise
-            
+
         Raises:
             ValueError: If the date format is invalid or check-out is before check-in
         """
@@ -338,19 +551,21 @@ class HotelManager:
         if not booking:
             print(f"Booking with ID {booking_id} not found.")
             return False
-        
+
         check_in_date = booking.check_in
         check_out_date = booking.check_out
-        
-        if check_in and check_in.strip():
+
+        # Already parsed dates have no strip(); only strings need the
+        # blank check before parsing.
+        if isinstance(check_in, datetime.date) or (check_in and check_in.strip()):
             try:
-                check_in_date = datetime.datetime.strptime(check_in, "%Y-%m-%d").date()
+                check_in_date = _parse_date(check_in)
             except ValueError:
                 raise ValueError("Invalid check-in date format. Please use YYYY-MM-DD format.")
-        
-        if check_out and check_out.strip():
+
+        if isinstance(check_out, datetime.date) or (check_out and check_out.strip()):
             try:
-                check_out_date = datetime.datetime.strptime(check_out, "%Y-%m-%d").date()
+                check_out_date = _parse_date(check_out)
             except ValueError:
                 raise ValueError("Invalid check-out date format. Please use YYYY-MM-DD format.")
         
@@ -362,9 +577,13 @@ class HotelManager:
             print(f"Room {booking.room_number} is not available for the selected dates.")
             return False
         
+        # Re-insert under the new check-in so the per-room list stays sorted
+        room_bookings = self._bookings_by_room[booking.room_number]
+        room_bookings.remove(booking)
         booking.check_in = check_in_date
         booking.check_out = check_out_date
-        self.save_data()
+        room_bookings.add(booking)
+        self._mark_dirty("bookings")
         return True
     
     def cancel_booking(self, booking_id):
@@ -382,9 +601,11 @@ class HotelManager:
             print(f"Booking with ID {booking_id} not found.")
             return False
         
-        # Remove the booking from the list
-        self.bookings = [b for b in self.bookings if b.booking_id != booking_id]
-        self.save_data()
+        # Remove the booking in place instead of rebuilding the whole list
+        self.bookings.remove(booking)
+        del self._bookings_by_id[booking_id]
+        self._bookings_by_room[booking.room_number].remove(booking)
+        self._mark_dirty("bookings")
         return True
     
     def find_booking(self, booking_id):
@@ -397,10 +618,7 @@ class HotelManager:
         Returns:
             Booking: The booking object if found, None otherwise
         """
-        for booking in self.bookings:
-            if booking.booking_id == booking_id:
-                return booking
-        return None
+        return self._bookings_by_id.get(booking_id)
     
     def search_booking(self, search_term):
         """
@@ -423,15 +641,12 @@ class HotelManager:
         if not results:
             print(f"No bookings found matching '{search_term}'.")
         else:
-            print("\nSEARCH RESULTS:")
-            print("-" * 80)
-            print(f"{'ID':<10} {'Guest ID':<10} {'Room':<10} {'Check-in':<12} {'Check-out':<12} {'Status':<10}")
-            print("-" * 80)
-            
-            for booking in results:
-                status = "Active" if booking.is_active else "Completed"
-                print(f"{booking.booking_id:<10} {booking.guest_id:<10} {booking.room_number:<10} {booking.check_in.isoformat():<12} {booking.check_out.isoformat():<12} {status:<10}")
-        
+            rows = [_BOOKING_ROW(booking.booking_id, booking.guest_id, booking.room_number,
+                                 booking.check_in.isoformat(), booking.check_out.isoformat(),
+                                 "Active" if booking.is_active else "Completed")
+                    for booking in results]
+            sys.stdout.write("\nSEARCH RESULTS:\n" + _BOOKING_HEADER + "\n".join(rows) + "\n")
+
         return results
     
     def view_all_bookings(self):
@@ -440,14 +655,11 @@ class HotelManager:
             print("No bookings available.")
             return
         
-        print("\nBOOKING LIST:")
-        print("-" * 80)
-        print(f"{'ID':<10} {'Guest ID':<10} {'Room':<10} {'Check-in':<12} {'Check-out':<12} {'Status':<10}")
-        print("-" * 80)
-        
-        for booking in self.bookings:
-            status = "Active" if booking.is_active else "Completed"
-            print(f"{booking.booking_id:<10} {booking.guest_id:<10} {booking.room_number:<10} {booking.check_in.isoformat():<12} {booking.check_out.isoformat():<12} {status:<10}")
+        rows = [_BOOKING_ROW(booking.booking_id, booking.guest_id, booking.room_number,
+                             booking.check_in.isoformat(), booking.check_out.isoformat(),
+                             "Active" if booking.is_active else "Completed")
+                for booking in self.bookings]
+        sys.stdout.write("\nBOOKING LIST:\n" + _BOOKING_HEADER + "\n".join(rows) + "\n")
     
     def is_room_available(self, room_number, check_in, check_out, exclude_booking_id=None):
         """
@@ -462,16 +674,27 @@ class HotelManager:
         Returns:
             bool: True if the room is available, False otherwise
         """
-        for booking in self.bookings:
-            if booking.room_number == room_number:
-                # Skip the booking if it's the one we're updating
-                if exclude_booking_id and booking.booking_id == exclude_booking_id:
-                    continue
-                
-                # Check if there's an overlap in dates
-                if (check_in < booking.check_out and check_out > booking.check_in):
-                    return False
-        
+        room_bookings = self._bookings_by_room.get(room_number)
+        if not room_bookings:
+            return True
+
+        # Existing bookings for a room never overlap each other, so sorted
+        # by check-in their check-outs are sorted too: scan back from the
+        # last booking starting before the requested check-out and stop at
+        # the first one that ends on or before the requested check-in.
+        # The cutoff is compared as an ordinal against the slot the date
+        # setters maintain, one integer branch per booking.
+        check_in_ord = check_in.toordinal()
+        idx = room_bookings.bisect_key_left(check_out)
+        for i in range(idx - 1, -1, -1):
+            booking = room_bookings[i]
+            if booking._co_ord <= check_in_ord:
+                break
+            # Skip the booking if it's the one we're updating
+            if exclude_booking_id and booking.booking_id == exclude_booking_id:
+                continue
+            return False
+
         return True
     
     # Billing Methods
@@ -492,10 +715,10 @@ class HotelManager:
             return None
         
         # Check if a bill already exists for this booking
-        for bill in self.bills:
-            if bill.booking_id == booking_id:
-                print(f"Bill already exists for booking {booking_id}.")
-                return bill
+        existing = self._bill_by_booking_id.get(booking_id)
+        if existing:
+            print(f"Bill already exists for booking {booking_id}.")
+            return existing
         
         # Calculate the total amount
         room = self.find_room(booking.room_number)
@@ -503,31 +726,52 @@ class HotelManager:
             print(f"Room {booking.room_number} not found.")
             return None
         
-        # Calculate the number of days
+        # Calculate the number of days; the amount is rounded to integer
+        # cents once here so all later comparisons are exact.
         days = (booking.check_out - booking.check_in).days
-        amount = days * room.price
-        
-        # Generate a unique bill ID
-        bill_id = str(uuid4())[:8]
-        bill = Bill(bill_id, booking_id, amount)
+        amount_cents = int(round(days * room.price * 100))
+
+        # Generate a sequential bill ID
+        bill_id = f"{self._next_bill_id:08d}"
+        self._next_bill_id += 1
+        bill = Bill(bill_id, booking_id, amount_cents)
         self.bills.append(bill)
-        self.save_data()
-        
-        print(f"\nBILL DETAILS:")
-        print("-" * 60)
-        print(f"Bill ID: {bill.bill_id}")
-        print(f"Booking ID: {bill.booking_id}")
-        print(f"Guest ID: {booking.guest_id}")
-        print(f"Room Number: {booking.room_number}")
-        print(f"Check-in Date: {booking.check_in.isoformat()}")
-        print(f"Check-out Date: {booking.check_out.isoformat()}")
-        print(f"Number of Days: {days}")
-        print(f"Room Rate per Night: ${room.price:.2f}")
-        print(f"Total Amount: ${bill.amount:.2f}")
-        print(f"Status: {bill.status}")
-        print("-" * 60)
+        self._bill_by_id[bill_id] = bill
+        self._bill_by_booking_id[booking_id] = bill
+        self._mark_dirty("bills")
         
+        print(self._render_bill(bill, booking, room, days))
+
         return bill
+
+    def _render_bill(self, bill, booking, room, days):
+        """
+        Render a bill and its booking context as the details text.
+
+        Args:
+            bill (Bill): The bill to render
+            booking (Booking): The booking the bill belongs to
+            room (Room): The booked room
+            days (int): The length of the stay in days
+
+        Returns:
+            str: The formatted bill details
+        """
+        return "\n".join([
+            "\nBILL DETAILS:",
+            "-" * 60,
+            f"Bill ID: {bill.bill_id}",
+            f"Booking ID: {bill.booking_id}",
+            f"Guest ID: {booking.guest_id}",
+            f"Room Number: {booking.room_number}",
+            f"Check-in Date: {booking.check_in.isoformat()}",
+            f"Check-out Date: {booking.check_out.isoformat()}",
+            f"Number of Days: {days}",
+            f"Room Rate per Night: ${room.price:.2f}",
+            f"Total Amount: ${bill.amount:.2f}",
+            f"Status: {bill.status}",
+            "-" * 60,
+        ])
     
     def process_payment(self, bill_id, amount):
         """
@@ -540,12 +784,7 @@ class HotelManager:
         Returns:
             bool: True if the payment was processed successfully, False otherwise
         """
-        bill = None
-        for b in self.bills:
-            if b.bill_id == bill_id:
-                bill = b
-                break
-        
+        bill = self._bill_by_id.get(bill_id)
         if not bill:
             print(f"Bill with ID {bill_id} not found.")
             return False
@@ -554,13 +793,15 @@ class HotelManager:
             print(f"Bill with ID {bill_id} is already paid.")
             return False
         
-        if amount < bill.amount:
+        # Compare in integer cents: an exact branch, immune to the float
+        # representation of amounts like 0.1 + 0.2.
+        if int(round(amount * 100)) < bill.amount_cents:
             print(f"Payment amount (${amount:.2f}) is less than the bill amount (${bill.amount:.2f}).")
             return False
         
         bill.status = "PAID"
-        bill.payment_date = datetime.datetime.now().date()
-        self.save_data()
+        bill.payment_date = datetime.date.today()
+        self._mark_dirty("bills")
         
         print(f"\nPAYMENT DETAILS:")
         print("-" * 60)
@@ -578,69 +819,103 @@ class HotelManager:
             print("No bills available.")
             return
         
-        print("\nBILL LIST:")
-        print("-" * 80)
-        print(f"{'Bill ID':<10} {'Booking ID':<10} {'Amount':<10} {'Status':<10} {'Payment Date':<12}")
-        print("-" * 80)
-        
-        for bill in self.bills:
-            payment_date = bill.payment_date.isoformat() if bill.payment_date else "N/A"
-            print(f"{bill.bill_id:<10} {bill.booking_id:<10} ${bill.amount:<9.2f} {bill.status:<10} {payment_date:<12}")
+        rows = [_BILL_ROW(bill.bill_id, bill.booking_id, bill.amount, bill.status,
+                          bill.payment_date.isoformat() if bill.payment_date else "N/A")
+                for bill in self.bills]
+        sys.stdout.write("\nBILL LIST:\n" + _BILL_HEADER + "\n".join(rows) + "\n")
     
     # Report Methods
     
+    def _compute_occupancy(self, today):
+        """
+        Aggregate occupancy figures for a given date.
+
+        Args:
+            today (datetime.date): The date to report occupancy for
+
+        Returns:
+            dict: Totals and a per-room-type breakdown of [total, occupied]
+        """
+        # One pass over the bookings gives the set of rooms occupied today;
+        # both counters below reuse it as a membership test. Comparing the
+        # cached ordinal slots keeps the filter to integer branches.
+        today_ord = today.toordinal()
+        occupied = {booking.room_number for booking in self.bookings
+                    if booking._ci_ord <= today_ord <= booking._co_ord}
+        # Bulk C-level intersection against the room index rather than a
+        # per-room membership loop; it also drops bookings whose room was
+        # removed.
+        occupied = occupied.intersection(self._rooms_by_number)
+        occupied_rooms = len(occupied)
+
+        # Room type breakdown: a single pass over the rooms, counting
+        # [total, occupied] per type against the precomputed occupied set.
+        by_type = defaultdict(lambda: [0, 0])
+        for room in self.rooms:
+            counts = by_type[room.type]
+            counts[0] += 1
+            counts[1] += room.number in occupied
+
+        return {
+            "date": today,
+            "total_rooms": len(self.rooms),
+            "occupied_rooms": occupied_rooms,
+            "by_type": by_type,
+        }
+
+    def _render_occupancy(self, data):
+        """
+        Render computed occupancy figures as the report text.
+
+        Args:
+            data (dict): The output of _compute_occupancy
+
+        Returns:
+            str: The formatted report
+        """
+        total_rooms = data["total_rooms"]
+        occupied_rooms = data["occupied_rooms"]
+        occupancy_rate = (occupied_rooms / total_rooms) * 100 if total_rooms > 0 else 0
+
+        lines = [
+            "\nOCCUPANCY REPORT:",
+            "-" * 60,
+            f"Date: {data['date'].isoformat()}",
+            f"Total Rooms: {total_rooms}",
+            f"Occupied Rooms: {occupied_rooms}",
+            f"Available Rooms: {total_rooms - occupied_rooms}",
+            f"Occupancy Rate: {occupancy_rate:.2f}%",
+            "-" * 60,
+            "\nROOM TYPE BREAKDOWN:",
+            "-" * 60,
+            f"{'Room Type':<15} {'Total':<10} {'Occupied':<10} {'Available':<10} {'Occupancy Rate':<15}",
+            "-" * 60,
+        ]
+
+        for room_type, (type_total, type_occupied) in data["by_type"].items():
+            occupancy_rate = (type_occupied / type_total) * 100 if type_total > 0 else 0
+            lines.append(f"{room_type:<15} {type_total:<10} {type_occupied:<10} {type_total - type_occupied:<10} {occupancy_rate:.2f}%")
+
+        return "\n".join(lines)
+
     def generate_occupancy_report(self):
         """Generate and display an occupancy report."""
         if not self.rooms:
             print("No rooms available.")
             return
-        
-        total_rooms = len(self.rooms)
-        occupied_rooms = 0
-        
-        today = datetime.datetime.now().date()
-        
-        for room in self.rooms:
-            for booking in self.bookings:
-                if (booking.room_number == room.number and 
-                    booking.check_in <= today <= booking.check_out):
-                    occupied_rooms += 1
-                    break
-        
-        occupancy_rate = (occupied_rooms / total_rooms) * 100 if total_rooms > 0 else 0
-        
-        print("\nOCCUPANCY REPORT:")
-        print("-" * 60)
-        print(f"Date: {today.isoformat()}")
-        print(f"Total Rooms: {total_rooms}")
-        print(f"Occupied Rooms: {occupied_rooms}")
-        print(f"Available Rooms: {total_rooms - occupied_rooms}")
-        print(f"Occupancy Rate: {occupancy_rate:.2f}%")
-        print("-" * 60)
-        
-        # Room type breakdown
-        room_types = {}
-        for room in self.rooms:
-            room_type = room.type
-            if room_type not in room_types:
-                room_types[room_type] = {"total": 0, "occupied": 0}
-            
-            room_types[room_type]["total"] += 1
-            
-            for booking in self.bookings:
-                if (booking.room_number == room.number and 
-                    booking.check_in <= today <= booking.check_out):
-                    room_types[room_type]["occupied"] += 1
-                    break
-        
-        print("\nROOM TYPE BREAKDOWN:")
-        print("-" * 60)
-        print(f"{'Room Type':<15} {'Total':<10} {'Occupied':<10} {'Available':<10} {'Occupancy Rate':<15}")
-        print("-" * 60)
-        
-        for room_type, data in room_types.items():
-            occupancy_rate = (data["occupied"] / data["total"]) * 100 if data["total"] > 0 else 0
-            print(f"{room_type:<15} {data['total']:<10} {data['occupied']:<10} {data['total'] - data['occupied']:<10} {occupancy_rate:.2f}%")
+
+        today = datetime.date.today()
+
+        # Serve the cached rendering if nothing changed since it was built
+        cache_key = ("occupancy", today)
+        cached = self._report_cache.get(cache_key)
+        if cached is not None and cached[0] == self._data_version:
+            print(cached[1])
+            return
+
+        text = self._render_occupancy(self._compute_occupancy(today))
+        self._report_cache[cache_key] = (self._data_version, text)
+        print(text)
     
     def generate_revenue_report(self, start_date, end_date):
         """
@@ -654,61 +929,118 @@ class HotelManager:
             ValueError: If the date format is invalid
         """
         try:
-            start = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-            end = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+            start = _parse_date(start_date)
+            end = _parse_date(end_date)
             
             if end < start:
                 raise ValueError("End date must be after start date.")
         except ValueError as e:
             raise ValueError(f"Invalid date format. Please use YYYY-MM-DD format. {str(e)}")
-        
-        total_revenue = 0
+
+        # Serve the cached rendering if nothing changed since it was built
+        cache_key = ("revenue", start, end)
+        cached = self._report_cache.get(cache_key)
+        if cached is not None and cached[0] == self._data_version:
+            print(cached[1])
+            return
+
+        text = self._render_revenue(self._compute_revenue(start, end))
+        self._report_cache[cache_key] = (self._data_version, text)
+        print(text)
+
+    def _compute_revenue(self, start, end):
+        """
+        Aggregate revenue figures for a period.
+
+        Args:
+            start (datetime.date): First day of the period
+            end (datetime.date): Last day of the period
+
+        Returns:
+            dict: Totals in integer cents and a per-room-type breakdown
+        """
+        total_cents = 0
         paid_bills = 0
         unpaid_bills = 0
-        
-        # Revenue by room type
-        room_type_revenue = {}
-        
+
+        # Revenue by room type, accumulated in integer cents
+        by_type_cents = defaultdict(int)
+
+        # Hoisted index lookups and bounds for the per-bill loop: one dict
+        # probe per bill, no object traversal for the room type, and all
+        # date work done as ordinal integers.
+        get_booking = self._bookings_by_id.get
+        get_room_type = {number: room.type
+                         for number, room in self._rooms_by_number.items()}.get
+        start_ord = start.toordinal()
+        end_ord = end.toordinal()
+
         for bill in self.bills:
             # Find the booking for this bill
-            booking = self.find_booking(bill.booking_id)
+            booking = get_booking(bill.booking_id)
             if not booking:
                 continue
-            
+
+            status = bill.status
             # Check if the payment date falls within the specified period
-            if bill.status == "PAID" and bill.payment_date and start <= bill.payment_date <= end:
-                total_revenue += bill.amount
-                paid_bills += 1
-                
-                # Find the room for this booking
-                room = self.find_room(booking.room_number)
-                if room:
-                    room_type = room.type
-                    if room_type not in room_type_revenue:
-                        room_type_revenue[room_type] = 0
-                    room_type_revenue[room_type] += bill.amount
-            
+            if status == "PAID":
+                payment_date = bill.payment_date
+                if payment_date and start <= payment_date <= end:
+                    total_cents += bill.amount_cents
+                    paid_bills += 1
+
+                    room_type = get_room_type(booking.room_number)
+                    if room_type is not None:
+                        by_type_cents[room_type] += bill.amount_cents
+
             # Count unpaid bills for bookings within the period
-            if bill.status == "UNPAID" and booking.check_in <= end and booking.check_out >= start:
+            elif status == "UNPAID" and booking._ci_ord <= end_ord and booking._co_ord >= start_ord:
                 unpaid_bills += 1
-        
-        print("\nREVENUE REPORT:")
-        print("-" * 60)
-        print(f"Period: {start.isoformat()} to {end.isoformat()}")
-        print(f"Total Revenue: ${total_revenue:.2f}")
-        print(f"Paid Bills: {paid_bills}")
-        print(f"Unpaid Bills: {unpaid_bills}")
-        print("-" * 60)
-        
-        if room_type_revenue:
-            print("\nREVENUE BY ROOM TYPE:")
-            print("-" * 60)
-            print(f"{'Room Type':<15} {'Revenue':<15} {'Percentage':<15}")
-            print("-" * 60)
-            
-            for room_type, revenue in room_type_revenue.items():
-                percentage = (revenue / total_revenue) * 100 if total_revenue > 0 else 0
-                print(f"{room_type:<15} ${revenue:<14.2f} {percentage:.2f}%")
+
+        return {
+            "start": start,
+            "end": end,
+            "total_cents": total_cents,
+            "paid_bills": paid_bills,
+            "unpaid_bills": unpaid_bills,
+            "by_type_cents": by_type_cents,
+        }
+
+    def _render_revenue(self, data):
+        """
+        Render computed revenue figures as the report text.
+
+        Args:
+            data (dict): The output of _compute_revenue
+
+        Returns:
+            str: The formatted report
+        """
+        total_cents = data["total_cents"]
+
+        lines = [
+            "\nREVENUE REPORT:",
+            "-" * 60,
+            f"Period: {data['start'].isoformat()} to {data['end'].isoformat()}",
+            f"Total Revenue: ${total_cents / 100:.2f}",
+            f"Paid Bills: {data['paid_bills']}",
+            f"Unpaid Bills: {data['unpaid_bills']}",
+            "-" * 60,
+        ]
+
+        if data["by_type_cents"]:
+            lines += [
+                "\nREVENUE BY ROOM TYPE:",
+                "-" * 60,
+                f"{'Room Type':<15} {'Revenue':<15} {'Percentage':<15}",
+                "-" * 60,
+            ]
+
+            for room_type, cents in data["by_type_cents"].items():
+                percentage = (cents / total_cents) * 100 if total_cents > 0 else 0
+                lines.append(f"{room_type:<15} ${cents / 100:<14.2f} {percentage:.2f}%")
+
+        return "\n".join(lines)
     
     def generate_guest_statistics(self):
         """Generate and display guest statistics."""
@@ -717,12 +1049,18 @@ class HotelManager:
             return
         
         total_guests = len(self.guests)
-        guests_with_bookings = set()
-        
-        for booking in self.bookings:
-            guests_with_bookings.add(booking.guest_id)
-        
-        guests_with_bookings_count = len(guests_with_bookings)
+
+        # One C-level pass gives both the per-guest booking counts and,
+        # via its key count, the number of distinct guests with bookings.
+        # The Counter is rebuilt only when the data version moved since
+        # the last statistics run.
+        cached = self._stats_cache
+        if cached is not None and cached[0] == self._data_version:
+            booking_counts = cached[1]
+        else:
+            booking_counts = Counter(booking.guest_id for booking in self.bookings)
+            self._stats_cache = (self._data_version, booking_counts)
+        guests_with_bookings_count = len(booking_counts)
         guests_without_bookings = total_guests - guests_with_bookings_count
         
         print("\nGUEST STATISTICS:")
@@ -732,25 +1070,14 @@ class HotelManager:
         print(f"Guests without Bookings: {guests_without_bookings}")
         print("-" * 60)
         
-        # Top guests by number of bookings
-        guest_booking_count = {}
-        for booking in self.bookings:
-            guest_id = booking.guest_id
-            if guest_id not in guest_booking_count:
-                guest_booking_count[guest_id] = 0
-            guest_booking_count[guest_id] += 1
-        
-        if guest_booking_count:
+        if booking_counts:
             print("\nTOP GUESTS BY NUMBER OF BOOKINGS:")
             print("-" * 60)
             print(f"{'Guest ID':<10} {'Name':<20} {'Bookings':<10}")
             print("-" * 60)
             
-            # Sort guests by booking count in descending order
-            sorted_guests = sorted(guest_booking_count.items(), key=lambda x: x[1], reverse=True)
-            
             # Display top 5 guests or all if less than 5
-            for i, (guest_id, count) in enumerate(sorted_guests[:5]):
-                guest = self.find_guest(guest_id)
+            for guest_id, count in booking_counts.most_common(5):
+                guest = self._guests_by_id.get(guest_id)
                 name = guest.name if guest else "Unknown"
                 print(f"{guest_id:<10} {name:<20} {count:<10}")
\ No newline at end of file
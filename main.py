@@ -5,317 +5,568 @@ This module serves as the entry point for the Hotel Management System.
 It provides a command-line interface for users to interact with the system.
 """
 
+import io
 import os
+import re
 import sys
-import time
-from hotel import HotelManager
-
-def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-def display_header():
-    """Display the application header."""
-    print("\n" + "=" * 60)
-    print(" " * 20 + "HOTEL MANAGEMENT SYSTEM")
-    print("=" * 60 + "\n")
-
-def display_menu():
-    """Display the main menu options."""
-    print("\nMAIN MENU:")
-    print("1. Room Management")
-    print("2. Guest Management")
-    print("3. Booking Management")
-    print("4. Billing")
-    print("5. Reports")
-    print("6. Exit")
-    print("\nPlease select an option (1-6): ", end="")
-
-def room_management_menu(hotel):
-    """Display and handle room management options."""
-    while True:
-        clear_screen()
-        print("\nROOM MANAGEMENT:")
-        print("1. View All Rooms")
-        print("2. Add New Room")
-        print("3. Update Room Details")
-        print("4. Search Room")
-        print("5. Back to Main Menu")
-        
-        choice = input("\nSelect an option (1-5): ")
-        
-        if choice == '1':
-            hotel.view_all_rooms()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            room_number = input("Enter Room Number: ")
-            room_type = input("Enter Room Type (Single/Double/Suite): ")
-            price = input("Enter Room Price per Night: ")
-            try:
-                price = float(price)
-                hotel.add_room(room_number, room_type, price)
-                print("\nRoom added successfully!")
-            except ValueError:
-                print("\nInvalid price. Please enter a valid number.")
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            room_number = input("Enter Room Number to Update: ")
-            if hotel.find_room(room_number):
-                room_type = input("Enter New Room Type (leave blank to keep current): ")
-                price = input("Enter New Room Price (leave blank to keep current): ")
-                hotel.update_room(room_number, room_type, price)
-                print("\nRoom updated successfully!")
-            else:
-                print(f"\nRoom {room_number} not found.")
-            input("\nPress Enter to continue...")
-        elif choice == '4':
-            room_number = input("Enter Room Number to Search: ")
-            room = hotel.find_room(room_number)
-            if room:
-                print(f"\nRoom Details:\nNumber: {room.number}\nType: {room.type}\nPrice: ${room.price:.2f}\nStatus: {'Occupied' if room.is_occupied else 'Available'}")
-            else:
-                print(f"\nRoom {room_number} not found.")
-            input("\nPress Enter to continue...")
-        elif choice == '5':
-            break
-        else:
-            print("\nInvalid option. Please try again.")
-            time.sleep(1)
+from contextlib import contextmanager
+from datetime import date
 
-def guest_management_menu(hotel):
-    """Display and handle guest management options."""
-    while True:
-        clear_screen()
-        print("\nGUEST MANAGEMENT:")
-        print("1. View All Guests")
-        print("2. Register New Guest")
-        print("3. Update Guest Information")
-        print("4. Search Guest")
-        print("5. Back to Main Menu")
-        
-        choice = input("\nSelect an option (1-5): ")
-        
-        if choice == '1':
-            hotel.view_all_guests()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            name = input("Enter Guest Name: ")
-            phone = input("Enter Guest Phone: ")
-            email = input("Enter Guest Email: ")
-            address = input("Enter Guest Address: ")
-            hotel.add_guest(name, phone, email, address)
-            print("\nGuest registered successfully!")
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            guest_id = input("Enter Guest ID to Update: ")
-            guest = hotel.find_guest(guest_id)
-            if guest:
-                name = input("Enter New Name (leave blank to keep current): ")
-                phone = input("Enter New Phone (leave blank to keep current): ")
-                email = input("Enter New Email (leave blank to keep current): ")
-                address = input("Enter New Address (leave blank to keep current): ")
-                hotel.update_guest(guest_id, name, phone, email, address)
-                print("\nGuest information updated successfully!")
-            else:
-                print(f"\nGuest with ID {guest_id} not found.")
-            input("\nPress Enter to continue...")
-        elif choice == '4':
-            search_term = input("Enter Guest Name or ID to Search: ")
-            hotel.search_guest(search_term)
-            input("\nPress Enter to continue...")
-        elif choice == '5':
-            break
-        else:
-            print("\nInvalid option. Please try again.")
-            time.sleep(1)
+# Shape check compiled once; the actual parsing is the C-implemented
+# date.fromisoformat, so a bad entry is rejected at the prompt instead
+# of surfacing as a traceback deeper in the call chain.
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 
-def booking_management_menu(hotel):
-    """Display and handle booking management options."""
-    while True:
-        clear_screen()
-        print("\nBOOKING MANAGEMENT:")
-        print("1. View All Bookings")
-        print("2. Create New Booking")
-        print("3. Update Booking")
-        print("4. Cancel Booking")
-        print("5. Search Booking")
-        print("6. Back to Main Menu")
-        
-        choice = input("\nSelect an option (1-6): ")
-        
-        if choice == '1':
-            hotel.view_all_bookings()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            guest_id = input("Enter Guest ID: ")
-            if not hotel.find_guest(guest_id):
-                print(f"\nGuest with ID {guest_id} not found. Please register the guest first.")
-                input("\nPress Enter to continue...")
-                continue
-                
-            room_number = input("Enter Room Number: ")
-            if not hotel.find_room(room_number):
-                print(f"\nRoom {room_number} not found.")
-                input("\nPress Enter to continue...")
-                continue
-                
-            check_in = input("Enter Check-in Date (YYYY-MM-DD): ")
-            check_out = input("Enter Check-out Date (YYYY-MM-DD): ")
-            
-            try:
-                booking_id = hotel.create_booking(guest_id, room_number, check_in, check_out)
-                if booking_id:
-                    print(f"\nBooking created successfully! Booking ID: {booking_id}")
-                else:
-                    print("\nFailed to create booking. Room might be unavailable for the selected dates.")
-            except ValueError as e:
-                print(f"\nError: {e}")
-            
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            booking_id = input("Enter Booking ID to Update: ")
-            booking = hotel.find_booking(booking_id)
-            if booking:
-                print("\nLeave fields blank to keep current values.")
-                check_in = input("Enter New Check-in Date (YYYY-MM-DD): ")
-                check_out = input("Enter New Check-out Date (YYYY-MM-DD): ")
-                
-                try:
-                    if hotel.update_booking(booking_id, check_in, check_out):
-                        print("\nBooking updated successfully!")
-                    else:
-                        print("\nFailed to update booking. Room might be unavailable for the selected dates.")
-                except ValueError as e:
-                    print(f"\nError: {e}")
-            else:
-                print(f"\nBooking with ID {booking_id} not found.")
-            
-            input("\nPress Enter to continue...")
-        elif choice == '4':
-            booking_id = input("Enter Booking ID to Cancel: ")
-            if hotel.cancel_booking(booking_id):
-                print("\nBooking cancelled successfully!")
-            else:
-                print(f"\nBooking with ID {booking_id} not found or already cancelled.")
-            
-            input("\nPress Enter to continue...")
-        elif choice == '5':
-            search_term = input("Enter Booking ID, Guest ID, or Room Number to Search: ")
-            hotel.search_booking(search_term)
-            input("\nPress Enter to continue...")
-        elif choice == '6':
-            break
+def parse_date(text):
+    """
+    Validate and parse a YYYY-MM-DD string entered by the user.
+
+    Args:
+        text (str): The date string to parse
+
+    Returns:
+        datetime.date: The parsed date
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    text = text.strip()
+    if not _DATE_RE.match(text):
+        raise ValueError(f"'{text}' is not a valid date. Please use YYYY-MM-DD format.")
+    return date.fromisoformat(text)
+
+def safe_float(text):
+    """
+    Parse a number entered by the user, or return None.
+
+    A cheap character check proves the common decimal shape valid
+    before float() runs, so the happy path never raises; float() stays
+    the authority on everything else, accepting forms like '1e5' the
+    quick check can't see and rejecting lookalikes such as repeated
+    signs or non-ASCII digits.
+
+    Args:
+        text (str): The number string to parse
+
+    Returns:
+        float: The parsed value, or None if the text is not a number
+    """
+    text = text.strip()
+    if not text:
+        return None
+    # Common case: a plain decimal number, provably valid without
+    # touching the exception machinery.
+    body = text[1:] if text[0] in '+-' else text
+    if body.isascii() and body.replace('.', '', 1).isdigit():
+        return float(text)
+    # Rarer spellings ('1e5', 'inf') and everything invalid fall back
+    # to float() itself.
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+# Clear-and-home escape sequence, honored by every modern terminal
+# including the Windows 10+ console.
+_CLEAR = '\x1b[2J\x1b[H'
+
+if os.name != 'nt' or sys.getwindowsversion().major >= 10:
+    def clear_screen():
+        """Clear the terminal screen with one escape-sequence write."""
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
+else:
+    def clear_screen():
+        """Clear the legacy Windows console, which lacks ANSI support."""
+        os.system('cls')
+
+# Static menu text, built once at import time. Each render is a single
+# buffered write instead of a string of print() calls that each format,
+# lock, and potentially flush stdout.
+
+HEADER_TEXT = ("\n" + "=" * 60 + "\n"
+               + " " * 20 + "HOTEL MANAGEMENT SYSTEM\n"
+               + "=" * 60 + "\n\n")
+
+MAIN_MENU_TEXT = ("\nMAIN MENU:\n"
+                  "1. Room Management\n"
+                  "2. Guest Management\n"
+                  "3. Booking Management\n"
+                  "4. Billing\n"
+                  "5. Reports\n"
+                  "6. Exit\n"
+                  "\nPlease select an option (1-6): ")
+
+ROOM_MENU_TEXT = ("\nROOM MANAGEMENT:\n"
+                  "1. View All Rooms\n"
+                  "2. Add New Room\n"
+                  "3. Update Room Details\n"
+                  "4. Search Room\n"
+                  "5. Back to Main Menu\n"
+                  "\nSelect an option (1-5): ")
+
+GUEST_MENU_TEXT = ("\nGUEST MANAGEMENT:\n"
+                   "1. View All Guests\n"
+                   "2. Register New Guest\n"
+                   "3. Update Guest Information\n"
+                   "4. Search Guest\n"
+                   "5. Back to Main Menu\n"
+                   "\nSelect an option (1-5): ")
+
+BOOKING_MENU_TEXT = ("\nBOOKING MANAGEMENT:\n"
+                     "1. View All Bookings\n"
+                     "2. Create New Booking\n"
+                     "3. Update Booking\n"
+                     "4. Cancel Booking\n"
+                     "5. Search Booking\n"
+                     "6. Back to Main Menu\n"
+                     "\nSelect an option (1-6): ")
+
+BILLING_MENU_TEXT = ("\nBILLING:\n"
+                     "1. Generate Bill for Booking\n"
+                     "2. View All Bills\n"
+                     "3. Process Payment\n"
+                     "4. Back to Main Menu\n"
+                     "\nSelect an option (1-4): ")
+
+REPORTS_MENU_TEXT = ("\nREPORTS:\n"
+                     "1. Occupancy Report\n"
+                     "2. Revenue Report\n"
+                     "3. Guest Statistics\n"
+                     "4. Back to Main Menu\n"
+                     "\nSelect an option (1-4): ")
+
+EXIT_TEXT = ("\nThank you for using the Hotel Management System!\n"
+             "Exiting the program...\n\n")
+
+# Bound stream methods for the interactive hot path: one LOAD_FAST per
+# prompt instead of re-resolving the sys attributes on every call.
+_stdout_write = sys.stdout.write
+_stdout_flush = sys.stdout.flush
+_readline = sys.stdin.readline
+
+def prompt(msg=''):
+    """
+    Write a prompt and read one line from stdin.
+
+    Unlike input(), this writes and flushes stdout exactly once and
+    never touches stderr.
+
+    Args:
+        msg (str, optional): The prompt text to display
+
+    Returns:
+        str: The entered line with the trailing newline stripped
+
+    Raises:
+        EOFError: If stdin is exhausted
+    """
+    if msg:
+        _stdout_write(msg)
+        _stdout_flush()
+    line = _readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+# Error from the previous interaction, shown atop the next menu render
+# instead of blocking the loop with a sleep.
+_last_error = ''
+
+def read_choice(menu_text):
+    """
+    Render a menu banner and read the user's choice.
+
+    Any pending error message is prepended to the banner and cleared.
+
+    Args:
+        menu_text (str): The banner to display, ending with the prompt
+
+    Returns:
+        str: The entered choice with the trailing newline stripped
+    """
+    global _last_error
+    if _last_error:
+        menu_text = _last_error + menu_text
+        _last_error = ''
+    return prompt(menu_text)
+
+def invalid_choice():
+    """Flag an unrecognized menu choice for the next render."""
+    global _last_error
+    _last_error = "\nInvalid option. Please try again.\n"
+
+def pause():
+    """Wait for the user before returning to the menu."""
+    prompt("\nPress Enter to continue...")
+
+@contextmanager
+def buffered_stdout():
+    """
+    Collect everything written to stdout and emit it as one write.
+
+    The output-heavy listing flows write inside this block; the whole
+    buffer then goes to the terminal with a single os.write to fd 1
+    instead of one syscall per row.
+    """
+    buf = io.StringIO()
+    old = sys.stdout
+    sys.stdout = buf
+    try:
+        yield
+    finally:
+        sys.stdout = old
+        os.write(1, buf.getvalue().encode())
+
+# Menu action handlers. Each takes the HotelManager, performs one
+# operation, and returns; the menu loop handles the pause and redraw.
+
+def view_rooms(hotel):
+    """Show the room list."""
+    with buffered_stdout():
+        hotel.view_all_rooms()
+
+def add_room(hotel):
+    """Prompt for and add a new room."""
+    room_number = prompt("Enter Room Number: ")
+    room_type = prompt("Enter Room Type (Single/Double/Suite): ")
+    price = safe_float(prompt("Enter Room Price per Night: "))
+    if price is None:
+        print("\nInvalid price. Please enter a valid number.")
+        return
+    hotel.add_room(room_number, room_type, price)
+    print("\nRoom added successfully!")
+
+def update_room(hotel):
+    """Prompt for and update a room's details."""
+    room_number = prompt("Enter Room Number to Update: ")
+    if room_number in hotel.rooms_by_number:
+        room_type = prompt("Enter New Room Type (leave blank to keep current): ")
+        price = prompt("Enter New Room Price (leave blank to keep current): ")
+        hotel.update_room(room_number, room_type, price)
+        print("\nRoom updated successfully!")
+    else:
+        print(f"\nRoom {room_number} not found.")
+
+def search_room(hotel):
+    """Look up and display one room."""
+    room_number = prompt("Enter Room Number to Search: ")
+    room = hotel.rooms_by_number.get(room_number)
+    if room:
+        print(f"\nRoom Details:\nNumber: {room.number}\nType: {room.type}\nPrice: ${room.price:.2f}\nStatus: {'Occupied' if room.is_occupied else 'Available'}")
+    else:
+        print(f"\nRoom {room_number} not found.")
+
+def view_guests(hotel):
+    """Show the guest list."""
+    with buffered_stdout():
+        hotel.view_all_guests()
+
+def register_guest(hotel):
+    """Prompt for and register a new guest."""
+    name = prompt("Enter Guest Name: ")
+    phone = prompt("Enter Guest Phone: ")
+    email = prompt("Enter Guest Email: ")
+    address = prompt("Enter Guest Address: ")
+    hotel.add_guest(name, phone, email, address)
+    print("\nGuest registered successfully!")
+
+def update_guest(hotel):
+    """Prompt for and update a guest's information."""
+    guest_id = prompt("Enter Guest ID to Update: ")
+    guest = hotel.guests_by_id.get(guest_id)
+    if guest:
+        name = prompt("Enter New Name (leave blank to keep current): ")
+        phone = prompt("Enter New Phone (leave blank to keep current): ")
+        email = prompt("Enter New Email (leave blank to keep current): ")
+        address = prompt("Enter New Address (leave blank to keep current): ")
+        hotel.update_guest(guest_id, name, phone, email, address)
+        print("\nGuest information updated successfully!")
+    else:
+        print(f"\nGuest with ID {guest_id} not found.")
+
+def search_guest(hotel):
+    """Search guests by name or ID."""
+    search_term = prompt("Enter Guest Name or ID to Search: ")
+    hotel.search_guest(search_term)
+
+def view_bookings(hotel):
+    """Show the booking list."""
+    with buffered_stdout():
+        hotel.view_all_bookings()
+
+def create_booking(hotel):
+    """Prompt for and create a new booking."""
+    # Resolve guest and room once and pass the objects down, so the
+    # existence checks here aren't repeated inside create_booking.
+    guest_id = prompt("Enter Guest ID: ")
+    guest = hotel.guests_by_id.get(guest_id)
+    if guest is None:
+        print(f"\nGuest with ID {guest_id} not found. Please register the guest first.")
+        return
+
+    room_number = prompt("Enter Room Number: ")
+    room = hotel.rooms_by_number.get(room_number)
+    if room is None:
+        print(f"\nRoom {room_number} not found.")
+        return
+
+    try:
+        check_in = parse_date(prompt("Enter Check-in Date (YYYY-MM-DD): "))
+        check_out = parse_date(prompt("Enter Check-out Date (YYYY-MM-DD): "))
+        booking_id = hotel.create_booking(guest, room, check_in, check_out)
+        if booking_id:
+            print(f"\nBooking created successfully! Booking ID: {booking_id}")
         else:
-            print("\nInvalid option. Please try again.")
-            time.sleep(1)
+            print("\nFailed to create booking. Room might be unavailable for the selected dates.")
+    except ValueError as e:
+        print(f"\nError: {e}")
 
-def billing_menu(hotel):
-    """Display and handle billing options."""
-    while True:
-        clear_screen()
-        print("\nBILLING:")
-        print("1. Generate Bill for Booking")
-        print("2. View All Bills")
-        print("3. Process Payment")
-        print("4. Back to Main Menu")
-        
-        choice = input("\nSelect an option (1-4): ")
-        
-        if choice == '1':
-            booking_id = input("Enter Booking ID: ")
-            bill = hotel.generate_bill(booking_id)
-            if bill:
-                print(f"\nBill generated successfully! Bill ID: {bill.bill_id}")
+def update_booking(hotel):
+    """Prompt for and update a booking's dates."""
+    booking_id = prompt("Enter Booking ID to Update: ")
+    booking = hotel.find_booking(booking_id)
+    if booking:
+        print("\nLeave fields blank to keep current values.")
+        check_in = prompt("Enter New Check-in Date (YYYY-MM-DD): ")
+        check_out = prompt("Enter New Check-out Date (YYYY-MM-DD): ")
+
+        try:
+            # Blank keeps the current value; anything else is validated here
+            check_in = parse_date(check_in) if check_in.strip() else check_in
+            check_out = parse_date(check_out) if check_out.strip() else check_out
+            if hotel.update_booking(booking_id, check_in, check_out):
+                print("\nBooking updated successfully!")
             else:
-                print(f"\nFailed to generate bill. Booking with ID {booking_id} not found or already billed.")
-            
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            hotel.view_all_bills()
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            bill_id = input("Enter Bill ID: ")
-            amount = input("Enter Payment Amount: ")
-            
-            try:
-                amount = float(amount)
-                if hotel.process_payment(bill_id, amount):
-                    print("\nPayment processed successfully!")
-                else:
-                    print(f"\nBill with ID {bill_id} not found or already paid.")
-            except ValueError:
-                print("\nInvalid amount. Please enter a valid number.")
-            
-            input("\nPress Enter to continue...")
-        elif choice == '4':
-            break
-        else:
-            print("\nInvalid option. Please try again.")
-            time.sleep(1)
+                print("\nFailed to update booking. Room might be unavailable for the selected dates.")
+        except ValueError as e:
+            print(f"\nError: {e}")
+    else:
+        print(f"\nBooking with ID {booking_id} not found.")
+
+def cancel_booking(hotel):
+    """Prompt for and cancel a booking."""
+    booking_id = prompt("Enter Booking ID to Cancel: ")
+    if hotel.cancel_booking(booking_id):
+        print("\nBooking cancelled successfully!")
+    else:
+        print(f"\nBooking with ID {booking_id} not found or already cancelled.")
+
+def search_booking(hotel):
+    """Search bookings by booking, guest, or room."""
+    search_term = prompt("Enter Booking ID, Guest ID, or Room Number to Search: ")
+    hotel.search_booking(search_term)
+
+def generate_bill(hotel):
+    """Prompt for a booking and generate its bill."""
+    booking_id = prompt("Enter Booking ID: ")
+    bill = hotel.generate_bill(booking_id)
+    if bill:
+        print(f"\nBill generated successfully! Bill ID: {bill.bill_id}")
+    else:
+        print(f"\nFailed to generate bill. Booking with ID {booking_id} not found or already billed.")
+
+def view_bills(hotel):
+    """Show the bill list."""
+    with buffered_stdout():
+        hotel.view_all_bills()
+
+def process_payment(hotel):
+    """Prompt for and process a bill payment."""
+    bill_id = prompt("Enter Bill ID: ")
+    amount = safe_float(prompt("Enter Payment Amount: "))
+    if amount is None:
+        print("\nInvalid amount. Please enter a valid number.")
+        return
+    if hotel.process_payment(bill_id, amount):
+        print("\nPayment processed successfully!")
+    else:
+        print(f"\nBill with ID {bill_id} not found or already paid.")
+
+def occupancy_report(hotel):
+    """Show the occupancy report."""
+    hotel.generate_occupancy_report()
+
+def revenue_report(hotel):
+    """Prompt for a period and show the revenue report."""
+    try:
+        start_date = parse_date(prompt("Enter Start Date (YYYY-MM-DD): "))
+        end_date = parse_date(prompt("Enter End Date (YYYY-MM-DD): "))
+        hotel.generate_revenue_report(start_date, end_date)
+    except ValueError as e:
+        print(f"\nError: {e}")
+
+def guest_statistics(hotel):
+    """Show the guest statistics report."""
+    hotel.generate_guest_statistics()
 
-def reports_menu(hotel):
-    """Display and handle reports options."""
+# Dispatch tables: menus are data, and each keystroke resolves with one
+# dict probe instead of walking an if/elif ladder.
+
+ROOM_MENU = {
+    '1': view_rooms,
+    '2': add_room,
+    '3': update_room,
+    '4': search_room,
+}
+
+GUEST_MENU = {
+    '1': view_guests,
+    '2': register_guest,
+    '3': update_guest,
+    '4': search_guest,
+}
+
+BOOKING_MENU = {
+    '1': view_bookings,
+    '2': create_booking,
+    '3': update_booking,
+    '4': cancel_booking,
+    '5': search_booking,
+}
+
+BILLING_MENU = {
+    '1': generate_bill,
+    '2': view_bills,
+    '3': process_payment,
+}
+
+REPORTS_MENU = {
+    '1': occupancy_report,
+    '2': revenue_report,
+    '3': guest_statistics,
+}
+
+# The five menu loops are identical except for name, banner, dispatch
+# table, and back key, so they are generated from this spec at import
+# time. Each comes out as a flat, specialized function - no generic
+# dispatcher in the loop - which also gives the adaptive interpreter
+# stable call sites to specialize.
+MENU_SPECS = (
+    ("room_management_menu", "room management", "ROOM_MENU_TEXT", "ROOM_MENU", '5'),
+    ("guest_management_menu", "guest management", "GUEST_MENU_TEXT", "GUEST_MENU", '5'),
+    ("booking_management_menu", "booking management", "BOOKING_MENU_TEXT", "BOOKING_MENU", '6'),
+    ("billing_menu", "billing", "BILLING_MENU_TEXT", "BILLING_MENU", '4'),
+    ("reports_menu", "reports", "REPORTS_MENU_TEXT", "REPORTS_MENU", '4'),
+)
+
+_MENU_TEMPLATE = '''\
+def {name}(hotel):
+    """Display and handle {topic} options."""
     while True:
         clear_screen()
-        print("\nREPORTS:")
-        print("1. Occupancy Report")
-        print("2. Revenue Report")
-        print("3. Guest Statistics")
-        print("4. Back to Main Menu")
-        
-        choice = input("\nSelect an option (1-4): ")
-        
-        if choice == '1':
-            hotel.generate_occupancy_report()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            start_date = input("Enter Start Date (YYYY-MM-DD): ")
-            end_date = input("Enter End Date (YYYY-MM-DD): ")
-            
-            try:
-                hotel.generate_revenue_report(start_date, end_date)
-            except ValueError as e:
-                print(f"\nError: {e}")
-            
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            hotel.generate_guest_statistics()
-            input("\nPress Enter to continue...")
-        elif choice == '4':
+        choice = read_choice({banner})
+        if choice == {back!r}:
             break
+
+        action = {table}.get(choice)
+        if action:
+            action(hotel)
+            pause()
         else:
-            print("\nInvalid option. Please try again.")
-            time.sleep(1)
+            invalid_choice()
+'''
+
+for _name, _topic, _banner, _table, _back in MENU_SPECS:
+    exec(compile(_MENU_TEMPLATE.format(name=_name, topic=_topic, banner=_banner,
+                                       table=_table, back=_back),
+                 __file__, "exec"))
+del _name, _topic, _banner, _table, _back
+
+def exit_program(hotel):
+    """Say goodbye and exit the program."""
+    clear_screen()
+    sys.stdout.write(EXIT_TEXT)
+    sys.exit(0)
+
+MAIN_MENU = {
+    '1': room_management_menu,
+    '2': guest_management_menu,
+    '3': booking_management_menu,
+    '4': billing_menu,
+    '5': reports_menu,
+    '6': exit_program,
+}
+
+# One-shot commands, routed to the same handlers the menus dispatch to.
+CLI_COMMANDS = {
+    ('room', 'list'): view_rooms,
+    ('room', 'add'): add_room,
+    ('room', 'update'): update_room,
+    ('room', 'show'): search_room,
+    ('guest', 'list'): view_guests,
+    ('guest', 'add'): register_guest,
+    ('guest', 'update'): update_guest,
+    ('guest', 'search'): search_guest,
+    ('booking', 'list'): view_bookings,
+    ('booking', 'add'): create_booking,
+    ('booking', 'update'): update_booking,
+    ('booking', 'cancel'): cancel_booking,
+    ('booking', 'search'): search_booking,
+    ('bill', 'generate'): generate_bill,
+    ('bill', 'list'): view_bills,
+    ('bill', 'pay'): process_payment,
+    ('report', 'occupancy'): occupancy_report,
+    ('report', 'revenue'): revenue_report,
+    ('report', 'stats'): guest_statistics,
+}
+
+def run_command(argv):
+    """
+    Execute a single command non-interactively and exit.
+
+    The command names a handler from CLI_COMMANDS and the remaining
+    arguments answer its prompts in order, e.g.:
+
+        main.py room add 101 Single 99.50
+
+    Skips all screen clearing and menu rendering; the handlers are the
+    same ones the interactive menus dispatch to.
+
+    Args:
+        argv (list): Command-line arguments after the program name
+    """
+    global _readline, _stdout_write, _stdout_flush
+
+    action = CLI_COMMANDS.get(tuple(argv[:2]))
+    if action is None:
+        commands = "\n  ".join(" ".join(key) for key in CLI_COMMANDS)
+        sys.stderr.write("Usage: main.py <command> [answers...]\n"
+                         "Commands:\n  " + commands + "\n")
+        sys.exit(2)
+
+    # Feed the leftover arguments to the handler's prompts in order;
+    # prompt text is suppressed and missing answers read as blank.
+    answers = iter(argv[2:])
+    _readline = lambda: next(answers, '') + '\n'
+    _stdout_write = lambda text: None
+    _stdout_flush = lambda: None
+
+    from hotel import HotelManager
+
+    with HotelManager() as hotel:
+        action(hotel)
+    sys.exit(0)
 
 def main():
     """Main function to run the Hotel Management System."""
+    if len(sys.argv) > 1:
+        run_command(sys.argv[1:])
+    # Deferred: pulls in the whole model and persistence stack, which
+    # tooling that imports this module for its helpers never needs.
+    from hotel import HotelManager
+
     hotel = HotelManager()
-    
+
     while True:
         clear_screen()
-        display_header()
-        display_menu()
-        
-        choice = input()
-        
-        if choice == '1':
-            room_management_menu(hotel)
-        elif choice == '2':
-            guest_management_menu(hotel)
-        elif choice == '3':
-            booking_management_menu(hotel)
-        elif choice == '4':
-            billing_menu(hotel)
-        elif choice == '5':
-            reports_menu(hotel)
-        elif choice == '6':
-            clear_screen()
-            print("\nThank you for using the Hotel Management System!")
-            print("Exiting the program...\n")
-            sys.exit(0)
+        choice = read_choice(HEADER_TEXT + MAIN_MENU_TEXT)
+
+        action = MAIN_MENU.get(choice)
+        if action:
+            action(hotel)
         else:
-            print("\nInvalid option. Please try again.")
-            time.sleep(1)
+            invalid_choice()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
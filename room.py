@@ -4,6 +4,8 @@ Hotel Management System - Room Module
 This module contains the Room class, which represents a hotel room.
 """
 
+import sys
+
 class Room:
     """
     Room class representing a hotel room.
@@ -11,22 +13,66 @@ class Room:
     This class contains information about a hotel room, including its
     number, type, price, and occupancy status.
     """
-    
+
+    __slots__ = ("number", "type", "_price", "_fmt_price", "is_occupied")
+
     def __init__(self, number, room_type, price, is_occupied=False):
         """
         Initialize a new Room object.
-        
+
         Args:
             number (str): The room number
             room_type (str): The type of room (Single, Double, Suite, etc.)
             price (float): The price per night
             is_occupied (bool, optional): Whether the room is currently occupied
         """
-        self.number = number
-        self.type = room_type
-        self.price = float(price)
+        # A hotel has a handful of distinct types (and numbers referenced
+        # all over bookings): interning collapses the copies to shared
+        # strings, so type grouping and number equality hit the
+        # pointer-comparison fast path.
+        self.number = sys.intern(number)
+        self.type = sys.intern(room_type)
+        self.price = price
         self.is_occupied = is_occupied
+
+    @property
+    def price(self):
+        """float: The price per night."""
+        return self._price
+
+    @price.setter
+    def price(self, value):
+        # The dollar rendering is cached with the value so __str__ never
+        # re-runs the :.2f format spec; prices change rarely, displays
+        # happen per row.
+        self._price = float(value)
+        self._fmt_price = f"${self._price:.2f}"
     
+    def __getstate__(self):
+        """
+        Return the room state as a tuple for pickling.
+
+        A tuple avoids the per-instance dict that the default slots
+        protocol would build.
+
+        Returns:
+            tuple: (number, type, price, is_occupied)
+        """
+        return (self.number, self.type, self._price, self.is_occupied)
+
+    def __setstate__(self, state):
+        """
+        Restore the room from its pickled tuple state.
+
+        Args:
+            state (tuple): (number, type, price, is_occupied)
+        """
+        number, room_type, price, is_occupied = state
+        self.number = sys.intern(number)
+        self.type = sys.intern(room_type)
+        self.price = price
+        self.is_occupied = is_occupied
+
     def to_dict(self):
         """
         Convert the Room object to a dictionary.
@@ -45,19 +91,25 @@ class Room:
     def from_dict(cls, data):
         """
         Create a Room object from a dictionary.
-        
+
+        Bypasses __init__ and fills the slots directly: persisted prices
+        are already floats, so the constructor's coercion would be a
+        wasted conversion per room on every load.
+
         Args:
             data (dict): A dictionary containing room data
-            
+
         Returns:
             Room: A new Room object
         """
-        return cls(
-            data["number"],
-            data["type"],
-            data["price"],
-            data["is_occupied"]
-        )
+        room = cls.__new__(cls)
+        room.number = sys.intern(data["number"])
+        room.type = sys.intern(data["type"])
+        price = data["price"]
+        room._price = price
+        room._fmt_price = f"${price:.2f}"
+        room.is_occupied = data["is_occupied"]
+        return room
     
     def __str__(self):
         """
@@ -66,5 +118,5 @@ class Room:
         Returns:
             str: A string representation of the Room object
         """
-        status = "Occupied" if self.is_occupied else "Available"
-        return f"Room {self.number} ({self.type}): ${self.price:.2f} per night - {status}"
\ No newline at end of file
+        return ("Room " + self.number + " (" + self.type + "): " + self._fmt_price
+                + " per night - " + ("Occupied" if self.is_occupied else "Available"))
\ No newline at end of file